@@ -1,37 +1,322 @@
 # Importing Packages
+import math
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
-from collections import Counter
 from wordcloud import WordCloud
+try:
+    import numba
+except ImportError:
+    numba = None
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+try:
+    import pyarrow
+    # Text columns are processed as Arrow strings (contiguous buffers with vectorized kernels)
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
+
+
+# Number of years of employment for each (textual) employment length in the datasets.
+# "< 1 year" is grouped with "1 year", and "10+ years" is capped at 10.
+EMP_LENGTH_YEARS = {
+    '< 1 year': 1, '1 year': 1, '2 years': 2, '3 years': 3, '4 years': 4, '5 years': 5,
+    '6 years': 6, '7 years': 7, '8 years': 8, '9 years': 9, '10+ years': 10
+}
+
+# Loan statuses of the approved loans that are considered as defaults
+DEFAULT_STATUSES = ['Charged Off', 'Default', 'Does not meet the credit policy. Status:Charged Off']
+# Columns of the datasets used by the EDA (the raw datasets have many more, which are never read)
+ACCEPTED_COLUMNS = [
+    'loan_status', 'funded_amnt', 'dti', 'addr_state', 'zip_code', 'emp_length', 'title', 
+    'int_rate', 'term', 'grade', 'inq_last_12m', 'fico_range_low', 'fico_range_high', 
+    'tot_hi_cred_lim', 'purpose'
+]
+REJECTED_COLUMNS = [
+    'Amount Requested', 'Debt-To-Income Ratio', 'State', 'Zip Code', 'Employment Length', 'Loan Title'
+]
+# Columns counted per default for the bar graphs of the defaults* methods.
+DEFAULTS_BAR_COLUMNS = ['term', 'grade', 'purpose']
+# Numeric columns of the approved dataset that are only used for boxplots, and so are stored 
+# in single precision. FICO scores and inquiry counts are integers, but have missing values 
+# (float32 represents them exactly).
+FLOAT32_COLUMNS = [
+    'funded_amnt', 'dti', 'int_rate', 'tot_hi_cred_lim', 
+    'fico_range_low', 'fico_range_high', 'inq_last_12m'
+]
+
+
+def csvToParquet(csv_path: str, parquet_path: str, columns: list) -> None:
+    """
+    This function converts a raw dataset to parquet (one-time ingest), keeping only 
+    the given columns.
+
+    ARGS:
+        :csv_path (str): Path of the csv dataset.
+        :parquet_path (str): Path of the parquet file to write.
+        :columns (list): Columns to keep (ACCEPTED_COLUMNS or REJECTED_COLUMNS).
+    
+    RETURNS:
+        :(None):
+    """
+    pd.read_csv(csv_path, usecols=columns, low_memory=False).to_parquet(parquet_path, index=False)
+
+
+def zscoreMask(values: np.ndarray, k: float = 3.0) -> np.ndarray:
+    """
+    This function flags the values that lie within k standard deviations of the mean.
+
+    The mean and standard deviation come from a single pass accumulating the sum and 
+    the sum of squares (in double precision), and the comparison is fused by numexpr 
+    when it is installed.
+
+    ARGS:
+        :values (np.ndarray): Values without missing entries.
+        :k (float): Number of standard deviations beyond which values are outliers.
+    
+    RETURNS:
+        :(np.ndarray): Boolean mask of the values that are not outliers.
+    """
+    n = values.size
+    total = values.sum(dtype=np.float64)
+    total_sq = np.einsum('i,i->', values, values, dtype=np.float64)
+    mean = total/n
+    std = math.sqrt(max(total_sq/n - mean*mean, 0.0))
+    if numexpr is not None:
+        return numexpr.evaluate('abs(values-mean) < k*std')
+    return np.abs(values-mean) < k*std
+
+
+def quantileCutoffs(values: np.ndarray, quantiles: list) -> np.ndarray:
+    """
+    This function computes quantiles of an array with a single partial sort.
+
+    np.partition places all the requested order statistics in O(N), whereas a quantile
+    computation sorts the whole array. The lower order statistic is used for each quantile
+    (no interpolation), which makes no difference for outlier clipping.
+
+    ARGS:
+        :values (np.ndarray): Values without missing entries.
+        :quantiles (list): Quantiles (between 0 and 1) to compute.
+    
+    RETURNS:
+        :(np.ndarray): Value at each of the quantiles (NaN for an empty array).
+    """
+    if values.size == 0:
+        return np.full(len(quantiles), np.nan)
+    ranks = [int(q*(values.size-1)) for q in quantiles]
+    return np.partition(values, ranks)[ranks]
+
+
+# Keyword arguments for horizontal boxplots with Axes.bxp (orientation was added in matplotlib 3.10, 
+# and deprecates vert)
+if tuple(int(v) for v in matplotlib.__version__.split('.')[:2]) >= (3, 10):
+    BXP_HORIZONTAL = {'orientation': 'horizontal'}
+else:
+    BXP_HORIZONTAL = {'vert': False}
+
+
+def boxplotStats(values: np.ndarray) -> dict:
+    """
+    This function computes the statistics drawn by a boxplot: the quartiles, and the 
+    whiskers at the most extreme values within 1.5 IQR of the box (as seaborn does).
+
+    ARGS:
+        :values (np.ndarray): Values without missing entries.
+    
+    RETURNS:
+        :(dict): Statistics in the format expected by matplotlib's Axes.bxp.
+    """
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    whislo = values[values >= q1 - 1.5*iqr].min()
+    whishi = values[values <= q3 + 1.5*iqr].max()
+    return {'q1': q1, 'med': median, 'q3': q3, 'whislo': whislo, 'whishi': whishi, 'fliers': []}
+
+
+def drawBoxplot(values: np.ndarray, ax: plt.Axes, color: str) -> None:
+    """
+    This function draws a horizontal boxplot from precomputed statistics, which skips
+    seaborn's DataFrame construction and the rendering of every outlier point.
+
+    ARGS:
+        :values (np.ndarray): Values without missing entries (an empty axis is left if there are none).
+        :ax (plt.Axes): Axes to draw on.
+        :color (str): Fill color of the box.
+    
+    RETURNS:
+        :(None):
+    """
+    if values.size > 0:
+        ax.bxp(
+            [boxplotStats(values)], showfliers=False, patch_artist=True,
+            boxprops={'facecolor': color}, medianprops={'color': 'black'}, **BXP_HORIZONTAL
+        )
+    ax.set_yticks([])
+
+
+def _splitByDefaultNumpy(values: np.ndarray, default_mask: np.ndarray, cutoff: float) -> tuple:
+    """
+    This function splits an array into the values for non-defaulters and defaulters,
+    dropping missing values and values at or above the cutoff.
+
+    ARGS:
+        :values (np.ndarray): Values of a numeric column.
+        :default_mask (np.ndarray): Boolean mask of defaulted loans.
+        :cutoff (float): Values at or above this are removed (np.inf to keep all).
+    
+    RETURNS:
+        :(tuple): Arrays of values for non-defaulters and defaulters.
+    """
+    # NaN compares as False, so this also drops missing values
+    valid = values < cutoff
+    return values[valid & ~default_mask], values[valid & default_mask]
+
+
+def _splitByDefaultNumba(values: np.ndarray, default_mask: np.ndarray, cutoff: float, n_chunks: int) -> tuple:
+    """
+    Numba kernel with the same behaviour as _splitByDefaultNumpy.
+
+    The array is processed in n_chunks chunks (one per thread): the first parallel pass 
+    counts the values of each group per chunk, and the second one copies them to their offsets.
+    """
+    n = values.size
+    chunk_size = (n + n_chunks - 1)//n_chunks
+    not_default_counts = np.zeros(n_chunks, dtype=np.int64)
+    default_counts = np.zeros(n_chunks, dtype=np.int64)
+
+    for c in numba.prange(n_chunks):
+        for i in range(c*chunk_size, min((c+1)*chunk_size, n)):
+            if values[i] < cutoff:
+                if default_mask[i]:
+                    default_counts[c] += 1
+                else:
+                    not_default_counts[c] += 1
+
+    not_default_offsets = np.zeros(n_chunks, dtype=np.int64)
+    default_offsets = np.zeros(n_chunks, dtype=np.int64)
+    for c in range(1, n_chunks):
+        not_default_offsets[c] = not_default_offsets[c-1] + not_default_counts[c-1]
+        default_offsets[c] = default_offsets[c-1] + default_counts[c-1]
+    not_default = np.empty(not_default_counts.sum(), dtype=values.dtype)
+    default = np.empty(default_counts.sum(), dtype=values.dtype)
+
+    for c in numba.prange(n_chunks):
+        j, k = not_default_offsets[c], default_offsets[c]
+        for i in range(c*chunk_size, min((c+1)*chunk_size, n)):
+            if values[i] < cutoff:
+                if default_mask[i]:
+                    default[k] = values[i]
+                    k += 1
+                else:
+                    not_default[j] = values[i]
+                    j += 1
+
+    return not_default, default
+
+
+if numba is not None:
+    # (fastmath is left off since it would let LLVM assume that there are no NaNs)
+    _splitByDefaultKernel = numba.njit(parallel=True, cache=True)(_splitByDefaultNumba)
+
+
+def splitByDefault(values: np.ndarray, default_mask: np.ndarray, cutoff: float) -> tuple:
+    """
+    This function splits an array into the values for non-defaulters and defaulters,
+    using the fused numba kernel when numba is installed and NumPy otherwise.
+
+    ARGS:
+        :values (np.ndarray): Values of a numeric column.
+        :default_mask (np.ndarray): Boolean mask of defaulted loans.
+        :cutoff (float): Values at or above this are removed (np.inf to keep all).
+    
+    RETURNS:
+        :(tuple): Arrays of values for non-defaulters and defaulters.
+    """
+    if numba is None:
+        return _splitByDefaultNumpy(values, default_mask, cutoff)
+    return _splitByDefaultKernel(values, default_mask, cutoff, numba.get_num_threads())
 
 
 class EDA:
-    def __init__(self, accepted: pd.DataFrame, rejected: pd.DataFrame) -> None:
+    def __init__(self, accepted: pd.DataFrame, rejected: pd.DataFrame, sample_n: int = 100_000) -> None:
         """
         This function initializes dataframes for the accepted and rejected datasets.
 
         ARGS:
             :accepted (pd.DataFrame): Dataset for approved loans.
             :rejected (pd.DataFrame): Dataset for rejected loans.
+            :sample_n (int): Number of approved loans (half defaulters, half non-defaulters)
+                sampled for the boxplots of the defaults* methods (outlier cutoffs are still 
+                computed on all of them). None to use all of them.
         
         RETURNS:
             :(None):
         """
-        # Initializing approved candidates
-        self.accepted = accepted
+        # Initializing approved candidates (a shallow copy, so that the columns added and
+        # recast below do not change the caller's dataframe)
+        self.accepted = accepted.copy(deep=False)
+        # Boolean mask of defaulted loans, cached once and reused by all the defaults* methods.
+        loan_status = self.accepted['loan_status']
+        if isinstance(loan_status.dtype, pd.CategoricalDtype):
+            # Only the few distinct loan statuses are compared to the default statuses, and the mask
+            # is gathered from their integer codes (missing statuses are coded -1, which indexes the 
+            # extra False at the end of the lookup).
+            is_default_status = loan_status.cat.categories.isin(DEFAULT_STATUSES)
+            self._default_mask = np.append(is_default_status, False)[loan_status.cat.codes.to_numpy()]
+        else:
+            # (casting to categorical would hash every string anyway, so isin is faster here)
+            self._default_mask = loan_status.isin(DEFAULT_STATUSES).to_numpy()
         # Adding binary default variable (0-no default, 1-default) for easy visualization
-        self.accepted['default'] = np.where(
-            self.accepted['loan_status'].isin(
-                ['Charged Off', 'Default', 'Does not meet the credit policy. Status:Charged Off']
-            ), 
-            1, 0
-        )
+        self.accepted['default'] = self._default_mask.view(np.int8)
+        # Low cardinality columns are stored as categoricals so that they are grouped on integer codes
+        for column in DEFAULTS_BAR_COLUMNS:
+            self.accepted[column] = self.accepted[column].astype('category')
+        # Downcasting boxplot columns, which halves the memory scanned by every plot
+        for column in FLOAT32_COLUMNS:
+            self.accepted[column] = self.accepted[column].astype(np.float32)
+        # Storing loan titles as strings (in a contiguous Arrow buffer if pyarrow is installed)
+        self.accepted['title'] = self.accepted['title'].astype(STRING_DTYPE)
         # Initializing rejected candidates
-        self.rejected = rejected
+        self.rejected = rejected.copy(deep=False)
+        self.rejected['Amount Requested'] = self.rejected['Amount Requested'].astype(np.float32)
+        # Word counts of the loan titles, computed on the first call of loanTitleWordClouds()
+        self._title_wordcounts = None
+        # Stratified sample (by default) of the approved loans used for the defaults* boxplots,
+        # since the quartiles converge well before millions of points
+        self._sample_idx = None
+        if sample_n is not None and sample_n < self.accepted.shape[0]:
+            rng = np.random.default_rng(0)
+            self._sample_idx = np.sort(np.concatenate([
+                rng.choice(np.flatnonzero(mask), min(sample_n//2, mask.sum()), replace=False)
+                for mask in (self._default_mask, ~self._default_mask)
+            ]))
     
+    @classmethod
+    def fromParquet(cls, accepted_path: str, rejected_path: str, sample_n: int = 100_000) -> 'EDA':
+        """
+        This function initializes the EDA from the parquet datasets (see csvToParquet),
+        reading only the columns used by the EDA.
+
+        ARGS:
+            :accepted_path (str): Path of the parquet dataset for approved loans.
+            :rejected_path (str): Path of the parquet dataset for rejected loans.
+            :sample_n (int): See __init__.
+        
+        RETURNS:
+            :(EDA):
+        """
+        return cls(
+            accepted=pd.read_parquet(accepted_path, columns=ACCEPTED_COLUMNS),
+            rejected=pd.read_parquet(rejected_path, columns=REJECTED_COLUMNS),
+            sample_n=sample_n
+        )
+
     def loanAmountRequested(self) -> None:
         """
         This function is used to compare the loan amount that approved and 
@@ -47,24 +332,16 @@ class EDA:
             :(None):
         """
         # Loan amounts of approved applicants
-        accepted_loan_amount = self.accepted['funded_amnt'].dropna()
+        accepted_loan_amount = self.accepted['funded_amnt'].to_numpy(dtype=np.float32, copy=False)
+        accepted_loan_amount = accepted_loan_amount[~np.isnan(accepted_loan_amount)]
         # Clipping outliers (points outside the 3rd standard deviation are removed)
-        accepted_loan_amount = pd.Series(
-            np.where(
-                np.abs(stats.zscore(accepted_loan_amount)) < 3, 
-                accepted_loan_amount, np.nan
-            )
-        ).dropna()
+        accepted_loan_amount = accepted_loan_amount[zscoreMask(accepted_loan_amount)]
 
         # Loan amounts of rejected applicants
-        rejected_loan_amount = self.rejected['Amount Requested'].dropna()
+        rejected_loan_amount = self.rejected['Amount Requested'].to_numpy(dtype=np.float32, copy=False)
+        rejected_loan_amount = rejected_loan_amount[~np.isnan(rejected_loan_amount)]
         # Clipping outliers (points outside the 3rd standard deviation are removed)
-        rejected_loan_amount = pd.Series(
-            np.where(
-                np.abs(stats.zscore(rejected_loan_amount)) < 3, 
-                rejected_loan_amount, np.nan
-            )
-        ).dropna()
+        rejected_loan_amount = rejected_loan_amount[zscoreMask(rejected_loan_amount)]
 
         # Plotting boxplots to compare the 2 distributions
         fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
@@ -96,27 +373,18 @@ class EDA:
             :(None):
         """
         # DTI of approved applicants
-        accepted_dti = self.accepted['dti'].dropna()
+        accepted_dti = self.accepted['dti'].to_numpy(dtype=np.float32, copy=False)
+        accepted_dti = accepted_dti[~np.isnan(accepted_dti)]
         # Clipping outliers (points outside the 3rd standard deviation are removed)
-        accepted_dti = pd.Series(
-            np.where(
-                np.abs(stats.zscore(accepted_dti)) < 3, 
-                accepted_dti, np.nan
-            )
-        ).dropna()
+        accepted_dti = accepted_dti[zscoreMask(accepted_dti)]
 
         # DTI of rejected applicants
         rejected_dti = self.rejected['Debt-To-Income Ratio'].dropna()
         # Cleaning text column and converting to float data type
-        rejected_dti = rejected_dti.apply(lambda dtiStr: dtiStr.replace("%", "")).astype(np.float32)
+        rejected_dti = rejected_dti.astype(STRING_DTYPE).str.rstrip('%').astype(np.float32).to_numpy()
         # Clipping outliers (points within the middle 98 percentile are retained)
-        rejected_dti = pd.Series(
-            np.where(
-                (rejected_dti < rejected_dti.quantile(0.99)) & 
-                (rejected_dti > rejected_dti.quantile(0.01)), 
-                rejected_dti, np.nan
-            )
-        ).dropna()
+        lower, upper = quantileCutoffs(rejected_dti, [0.01, 0.99])
+        rejected_dti = rejected_dti[(rejected_dti > lower) & (rejected_dti < upper)]
 
         # Plotting boxplots to compare the 2 distributions
         fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
@@ -148,9 +416,10 @@ class EDA:
             :(None):
         """
         # Ratio of number of approvals vs rejections for each state
+        # (states that only appear in one of the datasets have no ratio, and are not ranked)
         accept_to_reject_state_ratio = (
             self.accepted['addr_state'].value_counts()/self.rejected['State'].value_counts()
-        ).sort_values()
+        ).dropna().sort_values()
 
         print("STATES")
         print("Highest Accept-to-Reject ratio")
@@ -164,7 +433,7 @@ class EDA:
         # Ratio of number of approvals vs rejections for each zipcode
         accept_to_reject_zip_ratio = (
             self.accepted['zip_code'].value_counts()/self.rejected['Zip Code'].value_counts()
-        ).sort_values()
+        ).dropna().sort_values()
 
         print("ZIP CODES")
         print("Highest Accept-to-Reject ratio")
@@ -185,24 +454,20 @@ class EDA:
             :(None):
         """
         # Preprocessing the number of years of employment for approved applicants
-        accepted_emp_length = self.accepted['emp_length'].dropna().apply(
-            lambda length: "".join([l for l in length if l.isnumeric()])
-        ).astype(np.int32)
+        accepted_emp_length = self.accepted['emp_length'].map(EMP_LENGTH_YEARS).dropna().astype(np.int8)
 
         # Preprocessing the number of years of employment for rejected applicants
-        rejected_emp_length = self.rejected['Employment Length'].dropna().apply(
-            lambda length: "".join([l for l in length if l.isnumeric()])
-        ).astype(np.int32)
-
-        # Creating a temporary dataframe for visualization
-        emp_length_df = pd.DataFrame(
-            np.c_[
-                ((accepted_emp_length.value_counts().sort_index()/accepted_emp_length.shape[0])*100).round(2).to_numpy(),
-                ((rejected_emp_length.value_counts().sort_index()/rejected_emp_length.shape[0])*100).round(2).to_numpy()
-            ],
-            index=np.arange(1, 11, 1),
-            columns=['Accepted', 'Rejected']
-        )
+        rejected_emp_length = self.rejected['Employment Length'].map(EMP_LENGTH_YEARS).dropna().astype(np.int8)
+
+        # Creating a temporary dataframe for visualization, with the percent of applicants
+        # for each number of years of employment (0 if no applicant of a group has it)
+        emp_length_df = (pd.concat(
+            {
+                'Accepted': accepted_emp_length.value_counts(normalize=True),
+                'Rejected': rejected_emp_length.value_counts(normalize=True)
+            }, 
+            axis=1
+        ).fillna(0).sort_index()*100).round(2).rename_axis(index=None)
         # Plotting a bar graph to compare the approvals vs rejections for 
         # different years of employment
         fig, ax = plt.subplots(figsize=(8, 5))
@@ -212,6 +477,44 @@ class EDA:
         ax.set_ylabel('Percent of Loan Approvals/Rejections', size=12)
         plt.show()
 
+    def _titleWordCounts(self) -> tuple:
+        """
+        This function counts the words used in the loan titles of approved and rejected
+        applicants, keeping for each group the words it uses more often than the other 
+        (i.e. subtracting the word counters of the 2 groups).
+
+        The counts are cached, so the titles are only processed once.
+
+        ARGS:
+            :(None):
+        
+        RETURNS:
+            :(tuple): Word counts of approved and rejected applicants.
+        """
+        if self._title_wordcounts is not None:
+            return self._title_wordcounts
+
+        # Cleaning loan titles, lower casing them, splitting them into words,
+        # and counting their frequency.
+        accepted_words_count = self.accepted['title'].dropna().str.lower().str.split(' ').explode().value_counts(sort=False)
+        rejected_words_count = self.rejected['Loan Title'].dropna().astype(STRING_DTYPE).str.lower().str.split(' ').explode().value_counts(sort=False)
+
+        # (counts of Arrow strings can wrap read-only Arrow buffers, so they are copied before updating)
+        accepted_words_count = accepted_words_count.copy()
+        rejected_words_count = rejected_words_count.copy()
+
+        # Only the words used by both groups need to be subtracted, the others are kept as is
+        common_words = accepted_words_count.index.intersection(rejected_words_count.index)
+        common_diff = accepted_words_count.loc[common_words] - rejected_words_count.loc[common_words]
+        accepted_words_count.loc[common_words] = common_diff.clip(lower=0)
+        rejected_words_count.loc[common_words] = (-common_diff).clip(lower=0)
+
+        self._title_wordcounts = (
+            accepted_words_count[accepted_words_count > 0], 
+            rejected_words_count[rejected_words_count > 0]
+        )
+        return self._title_wordcounts
+
     def loanTitleWordClouds(self) -> None:
         """
         This function is used to create word clouds for the words used to describe
@@ -223,15 +526,12 @@ class EDA:
         RETURNS:
             :(None):
         """
-        # Cleaning loan titles, lower casing them, splitting them into words,
-        # and counting their frequency.
-        accepted_words_counter = Counter(self.accepted['title'].dropna().str.lower().str.split(' ').explode().to_list())
-        rejected_words_counter = Counter(self.rejected['Loan Title'].dropna().str.lower().str.split(' ').explode().to_list())
+        accepted_words_count, rejected_words_count = self._titleWordCounts()
 
         # Initializaing and creating the 2 word clouds 
         wc_accepted, wc_rejected = WordCloud(), WordCloud()
-        wc_accepted.fit_words(accepted_words_counter-rejected_words_counter)
-        wc_rejected.fit_words(rejected_words_counter-accepted_words_counter)
+        wc_accepted.fit_words(accepted_words_count.to_dict())
+        wc_rejected.fit_words(rejected_words_count.to_dict())
 
         # Visualzing the common (relatively distinct) words used in loan titles 
         # for approved and rejected candidates. 
@@ -246,10 +546,73 @@ class EDA:
         ax[1].set_title("Common Words in Rejected Loan Applications", size=20)
         plt.show()
 
-    def defaultsInterestRate(self) -> None:
+    def _splitByDefault(self, column: str, upper_quantile: float = None) -> tuple:
         """
-        This function is used to compare the interest rate of loans that are paid of 
-        and the ones that are defaulted on.
+        This function splits a numeric column of the approved applicants into the
+        values for non-defaulters and defaulters (missing values are dropped).
+
+        ARGS:
+            :column (str): Name of the column in the accepted dataset.
+            :upper_quantile (float): If given, values at or above this quantile are 
+                clipped as outliers.
+        
+        RETURNS:
+            :(tuple): Arrays of values for non-defaulters and defaulters.
+        """
+        values = self.accepted[column].to_numpy(dtype=np.float32)
+        # The outlier cutoff is computed on all the approved loans, since the stratified 
+        # sample over-represents defaulters
+        cutoff = np.inf
+        if upper_quantile is not None:
+            cutoff, = quantileCutoffs(values[~np.isnan(values)], [upper_quantile])
+        default_mask = self._default_mask
+        if self._sample_idx is not None:
+            values, default_mask = values[self._sample_idx], default_mask[self._sample_idx]
+        
+        return splitByDefault(values, default_mask, cutoff)
+
+    def _splitColumnsByDefault(self, columns: list) -> list:
+        """
+        This function splits several numeric columns of the approved applicants into the
+        values for non-defaulters and defaulters, reading all of them in a single scan 
+        (missing values are dropped from each column separately, as in _splitByDefault).
+
+        ARGS:
+            :columns (list): Names of the columns in the accepted dataset.
+        
+        RETURNS:
+            :(list): Arrays of values for non-defaulters and defaulters, for each column.
+        """
+        values = self.accepted[columns].to_numpy(dtype=np.float32)
+        default_mask = self._default_mask
+        if self._sample_idx is not None:
+            values, default_mask = values[self._sample_idx], default_mask[self._sample_idx]
+        not_default, default = values[~default_mask], values[default_mask]
+
+        return [
+            (not_default[~np.isnan(not_default[:, i]), i], default[~np.isnan(default[:, i]), i]) 
+            for i in range(len(columns))
+        ]
+
+    def _defaultCounts(self, column: str) -> pd.DataFrame:
+        """
+        This function counts the approved applicants for each value of a categorical 
+        column, separately for non-defaulters and defaulters.
+
+        ARGS:
+            :column (str): Name of the column in the accepted dataset.
+        
+        RETURNS:
+            :(pd.DataFrame): Counts with default (0/1) as index and the column values as columns.
+        """
+        return self.accepted.groupby(['default', column], observed=True).size().unstack(fill_value=0)
+
+    def report(self) -> None:
+        """
+        This function runs the complete EDA, plotting the comparisons of approved vs 
+        rejected applicants followed by the comparisons of defaulters vs non-defaulters.
+
+        All the defaults* plots are drawn on a single figure.
 
         ARGS:
             :(None):
@@ -257,30 +620,84 @@ class EDA:
         RETURNS:
             :(None):
         """
-        # Collecting the interest rates on defaulted and non-defaulted loans 
-        accepted_int_rate = self.accepted[['int_rate', 'default']].dropna(subset=['int_rate'])
-        accepted_not_default = np.where(
-            accepted_int_rate['default']==1, 
-            np.nan, accepted_int_rate['int_rate']
-        )
-        accepted_default = np.where(
-            accepted_int_rate['default']==1, 
-            accepted_int_rate['int_rate'], np.nan
-        )
+        self.loanAmountRequested()
+        self.dtiApplicants()
+        self.locationApplicants()
+        self.experienceOfApplicants()
+        self.loanTitleWordClouds()
+
+        fig = plt.figure(figsize=(16, 32))
+        gs = fig.add_gridspec(8, 2)
+
+        def boxplotAxes(row: int, col: int) -> list:
+            # Stacked axes (non-defaulters on top of defaulters) sharing the x-axis
+            top = fig.add_subplot(gs[row, col])
+            return [top, fig.add_subplot(gs[row+1, col], sharex=top)]
+
+        self._plotDefaultsInterestRate(boxplotAxes(0, 0))
+        self._plotDefaultsCreditInq(boxplotAxes(0, 1))
+        fico_low, fico_high = boxplotAxes(2, 0), boxplotAxes(2, 1)
+        self._plotDefaultsFicoRange(np.array([fico_low, fico_high]).T)
+        self._plotDefaultsCreditLimit(boxplotAxes(4, 0))
+        self._plotDefaultsTerm(fig.add_subplot(gs[4:6, 1]))
+        self._plotDefaultsLoanGrade(fig.add_subplot(gs[6:8, 0]))
+        self._plotDefaultsLoanPurpose(fig.add_subplot(gs[6:8, 1]))
+
+        fig.tight_layout()
+        plt.show()
 
-        # Plotting BoxPlots to compare the distributions
-        fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
+    def _plotDefaultsInterestRate(self, ax: list) -> None:
+        """
+        This function draws the interest rate boxplots of defaultsInterestRate.
 
-        sns.boxplot(x=accepted_not_default, ax=ax[0], color='lightblue')
+        ARGS:
+            :ax (list): Axes for non-defaulters and defaulters.
+        
+        RETURNS:
+            :(None):
+        """
+        # Collecting the interest rates on defaulted and non-defaulted loans 
+        accepted_not_default, accepted_default = self._splitByDefault('int_rate')
+
+        drawBoxplot(accepted_not_default, ax=ax[0], color='lightblue')
         ax[0].set_title("Interest rate for Non-Defaulters", size=15)
         ax[0].set_xlabel("")
 
-        sns.boxplot(x=accepted_default, ax=ax[1], color='orange')
+        drawBoxplot(accepted_default, ax=ax[1], color='orange')
         ax[1].set_title("Interest rate for Defaulters", size=15)
         ax[1].set_xlabel("")
 
+    def defaultsInterestRate(self) -> None:
+        """
+        This function is used to compare the interest rate of loans that are paid of 
+        and the ones that are defaulted on.
+
+        ARGS:
+            :(None):
+        
+        RETURNS:
+            :(None):
+        """
+        # Plotting BoxPlots to compare the distributions
+        fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
+        self._plotDefaultsInterestRate(ax)
         plt.show()
 
+    def _plotDefaultsTerm(self, ax: plt.Axes) -> None:
+        """
+        This function draws the bar graph of defaultsTerm.
+
+        ARGS:
+            :ax (plt.Axes): Axes to draw on.
+        
+        RETURNS:
+            :(None):
+        """
+        self._defaultCounts('term').plot.bar(ax=ax)
+        ax.set_xlabel('Deafult', size=12)
+        ax.set_ylabel('Number of Applications (in millions)', size=12) 
+        ax.set_title('Number of Defaults for 36 and 60 month loan terms', size=15)
+
     def defaultsTerm(self) -> None:
         """
         This function is used to compare the term of loans that are paid of 
@@ -294,12 +711,24 @@ class EDA:
         """
         # Plotting bar grahs to compare the effects of term size on defaults.
         fig, ax = plt.subplots(figsize=(8, 5))
-        self.accepted.groupby(by=['default'])['term'].value_counts().unstack().plot.bar(ax=ax)
-        ax.set_xlabel('Deafult', size=12)
-        ax.set_ylabel('Number of Applications (in millions)', size=12) 
-        ax.set_title('Number of Defaults for 36 and 60 month loan terms', size=15)
+        self._plotDefaultsTerm(ax)
         plt.show()
 
+    def _plotDefaultsLoanGrade(self, ax: plt.Axes) -> None:
+        """
+        This function draws the bar graph of defaultsLoanGrade.
+
+        ARGS:
+            :ax (plt.Axes): Axes to draw on.
+        
+        RETURNS:
+            :(None):
+        """
+        self._defaultCounts('grade').T.plot.bar(ax=ax)
+        ax.set_xlabel('Loan Grade', size=12)
+        ax.set_ylabel('Number of Applications (in millions)', size=12) 
+        ax.set_title('Number of Defaults w.r.t loan grades', size=15)
+
     def defaultsLoanGrade(self) -> None:
         """
         This function is used to uncover the correlation between the grade of the loan
@@ -313,57 +742,34 @@ class EDA:
         """
         # Plotting bar grahs to compare the effects of loan grades on defaults.
         fig, ax = plt.subplots(figsize=(8, 5))
-        self.accepted.groupby(by=['default'])['grade'].value_counts().unstack().T.plot.bar(ax=ax)
-        ax.set_xlabel('Loan Grade', size=12)
-        ax.set_ylabel('Number of Applications (in millions)', size=12) 
-        ax.set_title('Number of Defaults w.r.t loan grades', size=15)
+        self._plotDefaultsLoanGrade(ax)
         plt.show()
 
-    
-    def defaultsCreditInq(self) -> None:
+    def _plotDefaultsCreditInq(self, ax: list) -> None:
         """
-        This function is used to compare the number of credit inquiries made on 
-        loan applicants and how it correlates with the defaulted loans.
+        This function draws the credit inquiries boxplots of defaultsCreditInq.
 
         ARGS:
-            :(None):
+            :ax (list): Axes for non-defaulters and defaulters.
         
         RETURNS:
             :(None):
         """
-        # Collecting the number of credit inquiries of applicants
-        accepted_cr_inq = self.accepted[['inq_last_12m', 'default']].dropna(subset=['inq_last_12m'])
-        # Clipping top 1 percentile of outliers
-        accepted_cr_inq = accepted_cr_inq[
-            accepted_cr_inq['inq_last_12m']<accepted_cr_inq['inq_last_12m'].quantile(0.99)
-        ]
-        accepted_not_default = np.where(
-            accepted_cr_inq['default']==1, 
-            np.nan, accepted_cr_inq['inq_last_12m']
-        )
-        accepted_default = np.where(
-            accepted_cr_inq['default']==1, 
-            accepted_cr_inq['inq_last_12m'], np.nan
-        )
+        # Collecting the number of credit inquiries of applicants, clipping top 1 percentile of outliers
+        accepted_not_default, accepted_default = self._splitByDefault('inq_last_12m', upper_quantile=0.99)
 
-        # Visualizing the 2 distributions (number of inquiries for defaults and non-defaults)
-        # using boxplots
-        fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
-
-        sns.boxplot(x=accepted_not_default, ax=ax[0], color='lightblue')
+        drawBoxplot(accepted_not_default, ax=ax[0], color='lightblue')
         ax[0].set_title("Number of Credit Inquiries for Non-Defaulters", size=15)
         ax[0].set_xlabel("")
 
-        sns.boxplot(x=accepted_default, ax=ax[1], color='orange')
+        drawBoxplot(accepted_default, ax=ax[1], color='orange')
         ax[1].set_title("Number of Credit Inquiries for Defaulters", size=15)
         ax[1].set_xlabel("")
 
-        plt.show()
- 
-    def defaultsFicoRange(self) -> None:
+    def defaultsCreditInq(self) -> None:
         """
-        This function is used to compare the upper and lower FICO bounds for the applicants,
-        and how it correlates with defaults.
+        This function is used to compare the number of credit inquiries made on 
+        loan applicants and how it correlates with the defaulted loans.
 
         ARGS:
             :(None):
@@ -371,36 +777,84 @@ class EDA:
         RETURNS:
             :(None):
         """
-        fig, ax = plt.subplots(2, 2, figsize=(16, 8), sharex=True)
+        # Visualizing the 2 distributions (number of inquiries for defaults and non-defaults)
+        # using boxplots
+        fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
+        self._plotDefaultsCreditInq(ax)
+        plt.show()
+
+    def _plotDefaultsFicoRange(self, ax: np.ndarray) -> None:
+        """
+        This function draws the FICO range boxplots of defaultsFicoRange.
+
+        ARGS:
+            :ax (np.ndarray): 2x2 axes, with rows for non-defaulters and defaulters, 
+                and columns for the lower and upper FICO bounds.
         
+        RETURNS:
+            :(None):
+        """
+        # Collecting both FICO bounds of defaulted and non-defaulted loans in a single scan
+        fico_low, fico_high = self._splitColumnsByDefault(['fico_range_low', 'fico_range_high'])
+
         # Visualizing Lower FICO scores for defaulters and non-defaulters
-        accepted_fico_low = self.accepted[['fico_range_low', 'default']].dropna(subset=['fico_range_low'])
-        accepted_not_default = np.where(accepted_fico_low['default']==1, np.nan, accepted_fico_low['fico_range_low'])
-        accepted_default = np.where(accepted_fico_low['default']==1, accepted_fico_low['fico_range_low'], np.nan)
+        accepted_not_default, accepted_default = fico_low
 
-        sns.boxplot(x=accepted_not_default, ax=ax[0, 0], color='lightblue')
+        drawBoxplot(accepted_not_default, ax=ax[0, 0], color='lightblue')
         ax[0, 0].set_title("Lower FICO range for Non-Defaulters", size=15)
         ax[0, 0].set_xlabel("")
 
-        sns.boxplot(x=accepted_default, ax=ax[1, 0], color='orange')
+        drawBoxplot(accepted_default, ax=ax[1, 0], color='orange')
         ax[1, 0].set_title("Lower FICO range for Defaulters", size=15)
         ax[1, 0].set_xlabel("")
 
         # Visualizing Upper FICO scores for defaulters and non-defaulters
-        accepted_fico_high = self.accepted[['fico_range_high', 'default']].dropna(subset=['fico_range_high'])
-        accepted_not_default = np.where(accepted_fico_high['default']==1, np.nan, accepted_fico_high['fico_range_high'])
-        accepted_default = np.where(accepted_fico_high['default']==1, accepted_fico_high['fico_range_high'], np.nan)
+        accepted_not_default, accepted_default = fico_high
 
-        sns.boxplot(x=accepted_not_default, ax=ax[0, 1], color='lightblue')
+        drawBoxplot(accepted_not_default, ax=ax[0, 1], color='lightblue')
         ax[0, 1].set_title("Upper FICO range for Non-Defaulters", size=15)
         ax[0, 1].set_xlabel("")
 
-        sns.boxplot(x=accepted_default, ax=ax[1, 1], color='orange')
+        drawBoxplot(accepted_default, ax=ax[1, 1], color='orange')
         ax[1, 1].set_title("Upper FICO range for Defaulters", size=15)
         ax[1, 1].set_xlabel("")
 
+    def defaultsFicoRange(self) -> None:
+        """
+        This function is used to compare the upper and lower FICO bounds for the applicants,
+        and how it correlates with defaults.
+
+        ARGS:
+            :(None):
+        
+        RETURNS:
+            :(None):
+        """
+        fig, ax = plt.subplots(2, 2, figsize=(16, 8), sharex=True)
+        self._plotDefaultsFicoRange(ax)
         plt.show()
 
+    def _plotDefaultsCreditLimit(self, ax: list) -> None:
+        """
+        This function draws the credit limit boxplots of defaultsCreditLimit.
+
+        ARGS:
+            :ax (list): Axes for non-defaulters and defaulters.
+        
+        RETURNS:
+            :(None):
+        """
+        # Collecting the credit limit of applicants, clipping top 1 percentile of outliers
+        accepted_not_default, accepted_default = self._splitByDefault('tot_hi_cred_lim', upper_quantile=0.99)
+
+        drawBoxplot(accepted_not_default, ax=ax[0], color='lightblue')
+        ax[0].set_title("Credit Limit for Non-Defaulters", size=15)
+        ax[0].set_xlabel("")
+
+        drawBoxplot(accepted_default, ax=ax[1], color='orange')
+        ax[1].set_title("Credit Limit for Defaulters", size=15)
+        ax[1].set_xlabel("")
+
     def defaultsCreditLimit(self) -> None:
         """
         This function is used to compare the credit limit of applicants and how it
@@ -412,34 +866,26 @@ class EDA:
         RETURNS:
             :(None):
         """
-        # Collecting the credit limit of applicants
-        accepted_credit_limit = self.accepted[['tot_hi_cred_lim', 'default']].dropna(subset=['tot_hi_cred_lim'])
-        # Clipping top 1 percentile of outliers
-        accepted_credit_limit = accepted_credit_limit[
-            accepted_credit_limit['tot_hi_cred_lim']<accepted_credit_limit['tot_hi_cred_lim'].quantile(0.99)
-        ]
-        accepted_not_default = np.where(
-            accepted_credit_limit['default']==1, 
-            np.nan, accepted_credit_limit['tot_hi_cred_lim']
-        )
-        accepted_default = np.where(
-            accepted_credit_limit['default']==1, 
-            accepted_credit_limit['tot_hi_cred_lim'], np.nan
-        )
-        
         # Visualizing the 2 distributions (credit limit for defaults and non-defaults)
         # using boxplots
         fig, ax = plt.subplots(2, 1, figsize=(8, 8), sharex=True)
+        self._plotDefaultsCreditLimit(ax)
+        plt.show()
 
-        sns.boxplot(x=accepted_not_default, ax=ax[0], color='lightblue')
-        ax[0].set_title("Credit Limit for Non-Defaulters", size=15)
-        ax[0].set_xlabel("")
-
-        sns.boxplot(x=accepted_default, ax=ax[1], color='orange')
-        ax[1].set_title("Credit Limit for Defaulters", size=15)
-        ax[1].set_xlabel("")
+    def _plotDefaultsLoanPurpose(self, ax: plt.Axes) -> None:
+        """
+        This function draws the bar graph of defaultsLoanPurpose.
 
-        plt.show()
+        ARGS:
+            :ax (plt.Axes): Axes to draw on.
+        
+        RETURNS:
+            :(None):
+        """
+        self._defaultCounts('purpose').T.plot.bar(ax=ax)
+        ax.set_xlabel('Loan Purpose', size=12)
+        ax.set_ylabel('Number of Applications (in millions)', size=12) 
+        ax.set_title('Purpose of Loan for Defaulters and Non-Defaulters', size=15)
 
     def defaultsLoanPurpose(self) -> None:
         """
@@ -454,8 +900,5 @@ class EDA:
         """
         # Plotting bar grahs to compare the effects of loan purpose on defaults.
         fig, ax = plt.subplots(figsize=(8, 5))
-        self.accepted.groupby(by=['default'])['purpose'].value_counts().unstack().T.plot.bar(ax=ax)
-        ax.set_xlabel('Loan Purpose', size=12)
-        ax.set_ylabel('Number of Applications (in millions)', size=12) 
-        ax.set_title('Purpose of Loan for Defaulters and Non-Defaulters', size=15)
-        plt.show()
\ No newline at end of file
+        self._plotDefaultsLoanPurpose(ax)
+        plt.show()